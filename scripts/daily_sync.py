@@ -16,7 +16,7 @@ import argparse
 import logging
 import signal
 import sys
-import os
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -81,7 +81,8 @@ def run_sync(config: Config, upload: bool = True, notify: bool = True) -> bool:
                 logger.info("Deploying feed to GitHub Pages...")
                 try:
                     from deploy_feed import deploy_to_gh_pages
-                    deploy_to_gh_pages(result.feed_path)
+                    if not deploy_to_gh_pages(result.feed_path):
+                        logger.error("Failed to deploy to GitHub Pages")
                 except Exception as e:
                     logger.error(f"Failed to deploy to GitHub Pages: {e}")
 
@@ -116,8 +117,6 @@ def run_scheduler(config: Config, sync_time: str, upload: bool, notify: bool):
         print("Install with: pip install schedule")
         sys.exit(1)
 
-    import time
-
     logger = logging.getLogger(__name__)
     logger.info(f"Starting scheduler. Sync will run daily at {sync_time}")
 
@@ -129,13 +128,12 @@ def run_scheduler(config: Config, sync_time: str, upload: bool, notify: bool):
     # Schedule the job
     schedule.every().day.at(sync_time).do(sync_job)
 
-    # Handle graceful shutdown
-    running = True
+    # Handle graceful shutdown; setting the event also wakes the idle wait
+    stop_event = threading.Event()
 
     def signal_handler(signum, frame):
-        nonlocal running
         logger.info("Shutdown signal received. Stopping scheduler...")
-        running = False
+        stop_event.set()
 
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
@@ -143,9 +141,11 @@ def run_scheduler(config: Config, sync_time: str, upload: bool, notify: bool):
     # Run the scheduler
     logger.info("Scheduler is running. Press Ctrl+C to stop.")
 
-    while running:
+    while not stop_event.is_set():
         schedule.run_pending()
-        time.sleep(60)  # Check every minute
+        # Sleep until the next job is due instead of polling
+        idle = schedule.idle_seconds()
+        stop_event.wait(max(idle, 0) if idle is not None else None)
 
     logger.info("Scheduler stopped.")
 
@@ -13,48 +13,24 @@ Usage:
 
 import argparse
 import os
-import shutil
+import random
 import subprocess
 import sys
-import tempfile
+import time
 from pathlib import Path
 
+# Push retry policy: capped exponential backoff plus random jitter so
+# concurrent deploys don't retry in lockstep
+PUSH_ATTEMPTS = 4
+PUSH_BACKOFF_CAP = 30
+PUSH_BACKOFF_JITTER = 2
 
-def run(cmd, **kwargs):
-    """Run a shell command and return output."""
-    result = subprocess.run(
-        cmd, shell=True, capture_output=True, text=True, **kwargs
-    )
-    if result.returncode != 0:
-        print(f"Command failed: {cmd}")
-        print(f"stderr: {result.stderr}")
-    return result
-
-
-def deploy_to_gh_pages(feed_path: str, repo_dir: str = None):
-    """Deploy feed file to gh-pages branch."""
-    repo_dir = repo_dir or os.getcwd()
-    feed_file = Path(feed_path)
-
-    if not feed_file.exists():
-        print(f"Error: Feed file not found: {feed_path}")
-        print("Run a sync first: python3 -m vimeo_roku_sdk.cli sync --config config.yaml")
-        sys.exit(1)
-
-    feed_size = feed_file.stat().st_size
-    print(f"Deploying feed to GitHub Pages...")
-    print(f"  Feed file: {feed_path} ({feed_size / 1024:.1f} KB)")
+# Explicit refspec so origin/gh-pages is updated even when the remote's
+# fetch refspec doesn't cover it (e.g. single-branch or shallow clones)
+GH_PAGES_REFSPEC = "+refs/heads/gh-pages:refs/remotes/origin/gh-pages"
 
-    # Save current branch
-    current_branch = run("git rev-parse --abbrev-ref HEAD", cwd=repo_dir).stdout.strip()
 
-    # Create a temp directory for the gh-pages content
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Copy the feed file
-        shutil.copy2(str(feed_file), os.path.join(tmpdir, "roku_feed.json"))
-
-        # Create a simple index.html
-        index_html = """<!DOCTYPE html>
+INDEX_HTML = """<!DOCTYPE html>
 <html>
 <head>
     <title>Knox Media Group - Roku Feed</title>
@@ -74,68 +50,192 @@ def deploy_to_gh_pages(feed_path: str, repo_dir: str = None):
     <p>Use this URL in your Roku Direct Publisher channel configuration.</p>
 </body>
 </html>"""
-        with open(os.path.join(tmpdir, "index.html"), "w") as f:
-            f.write(index_html)
-
-        # Add .nojekyll to prevent Jekyll processing
-        Path(os.path.join(tmpdir, ".nojekyll")).touch()
-
-        # Check if gh-pages branch exists
-        check = run("git ls-remote --heads origin gh-pages", cwd=repo_dir)
-        gh_pages_exists = "gh-pages" in check.stdout
-
-        if gh_pages_exists:
-            # Checkout existing gh-pages
-            run("git fetch origin gh-pages", cwd=repo_dir)
-            run("git checkout gh-pages", cwd=repo_dir)
-        else:
-            # Create orphan gh-pages branch
-            run("git checkout --orphan gh-pages", cwd=repo_dir)
-            run("git rm -rf .", cwd=repo_dir)
-
-        # Copy files from temp dir to repo
-        for filename in ["roku_feed.json", "index.html", ".nojekyll"]:
-            src = os.path.join(tmpdir, filename)
-            dst = os.path.join(repo_dir, filename)
-            shutil.copy2(src, dst)
-
-        # Commit and push
-        run("git add roku_feed.json index.html .nojekyll", cwd=repo_dir)
-
-        # Check if there are changes to commit
-        status = run("git status --porcelain", cwd=repo_dir)
-        if status.stdout.strip():
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-            run(
-                f'git commit -m "Update Roku feed - {timestamp}"',
-                cwd=repo_dir
-            )
-            print("  Pushing to gh-pages branch...")
-
-            # Push with retries
-            for attempt in range(4):
-                result = run("git push -u origin gh-pages", cwd=repo_dir)
-                if result.returncode == 0:
-                    break
-                if attempt < 3:
-                    import time
-                    wait = 2 ** (attempt + 1)
-                    print(f"  Push failed, retrying in {wait}s...")
-                    time.sleep(wait)
 
-            print("  Deployed successfully!")
-        else:
-            print("  No changes to deploy (feed unchanged)")
 
-        # Switch back to original branch
-        run(f"git checkout {current_branch}", cwd=repo_dir)
+class DeployError(Exception):
+    """A git step of the deploy failed."""
+
+
+def run(cmd, **kwargs):
+    """Run a command (argv list, no shell) and return output."""
+    result = subprocess.run(
+        cmd, capture_output=True, text=True, **kwargs
+    )
+    if result.returncode != 0:
+        print(f"Command failed: {' '.join(cmd)}")
+        print(f"stderr: {result.stderr}")
+    return result
+
+
+def deploy_to_gh_pages(feed_path: str, repo_dir: str = None) -> bool:
+    """
+    Deploy feed file to gh-pages branch.
+
+    Returns:
+        True if the feed is live (deployed or already up to date)
+    """
+    repo_dir = repo_dir or os.getcwd()
+    feed_file = Path(feed_path)
+
+    try:
+        feed_size = feed_file.stat().st_size
+    except FileNotFoundError:
+        print(f"Error: Feed file not found: {feed_path}")
+        print("Run a sync first: python3 -m vimeo_roku_sdk.cli sync --config config.yaml")
+        return False
+
+    print(f"Deploying feed to GitHub Pages...")
+    print(f"  Feed file: {feed_path} ({feed_size / 1024:.1f} KB)")
+
+    try:
+        if not _deploy(feed_file, repo_dir):
+            return False
+    except DeployError as e:
+        print(f"Error: {e}")
+        return False
 
     print()
     print("Your feed is available at:")
     print("  https://knox-media-group.github.io/KMGI/roku_feed.json")
     print()
     print("Use this URL in your Roku Direct Publisher channel settings.")
+    return True
+
+
+def _deploy(feed_file: Path, repo_dir: str) -> bool:
+    """Publish the feed unless gh-pages already has it; True on success."""
+    # Fetch gh-pages in the background; writing the site blobs doesn't
+    # depend on it, so the disk work overlaps the network round trip. A
+    # failed fetch means the branch doesn't exist yet.
+    fetch = subprocess.Popen(
+        ["git", "fetch", "origin", GH_PAGES_REFSPEC], cwd=repo_dir,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    try:
+        blobs = {
+            "roku_feed.json": _write_blob(repo_dir, path=feed_file),
+            "index.html": _write_blob(repo_dir, data=INDEX_HTML),
+            # .nojekyll prevents Jekyll processing
+            ".nojekyll": _write_blob(repo_dir, data=""),
+        }
+    finally:
+        _, fetch_stderr = fetch.communicate()
+    gh_pages_exists = fetch.returncode == 0
+    if not gh_pages_exists and "couldn't find remote ref" not in fetch_stderr:
+        print(f"Command failed: git fetch origin {GH_PAGES_REFSPEC}")
+        print(f"stderr: {fetch_stderr}")
+
+    # One ls-tree answers every read-only question about the published
+    # site (current feed blob, files to keep), instead of a rev-parse each
+    site = _list_tree(repo_dir, "origin/gh-pages") if gh_pages_exists else {}
+
+    if site.get("roku_feed.json") == _tree_entry("roku_feed.json", blobs["roku_feed.json"]):
+        print("  No changes to deploy (feed unchanged)")
+        return True
+    return _publish(blobs, repo_dir, site if gh_pages_exists else None)
+
+
+def _publish(blobs: dict, repo_dir: str, site: dict = None) -> bool:
+    """
+    Commit the site files to gh-pages and push.
+
+    Returns True once gh-pages has the site files.
+
+    Args:
+        blobs: File name to object ID of the site files, already written
+        repo_dir: Path to the git repository
+        site: Current origin/gh-pages entries, or None to start the branch
+    """
+    # Build the gh-pages commit with git plumbing (blobs -> tree -> commit)
+    # so nothing is checked out and the caller's work tree is never touched
+    parent = "origin/gh-pages" if site is not None else None
+    commit = _build_commit(repo_dir, blobs, site or {}, parent)
+    if commit is None:
+        print("  No changes to deploy (feed unchanged)")
+        return True
+
+    print("  Pushing to gh-pages branch...")
+
+    # Push with retries
+    for attempt in range(PUSH_ATTEMPTS):
+        result = run(["git", "push", "origin", f"{commit}:refs/heads/gh-pages"], cwd=repo_dir)
+        if result.returncode == 0:
+            print("  Deployed successfully!")
+            return True
+        if attempt < PUSH_ATTEMPTS - 1:
+            # Remote moved on (e.g. another deploy); rebuild the commit on
+            # top of it so the retry can actually succeed
+            if "non-fast-forward" in result.stderr or "fetch first" in result.stderr:
+                run(["git", "fetch", "origin", GH_PAGES_REFSPEC], cwd=repo_dir)
+                site = _list_tree(repo_dir, "origin/gh-pages")
+                commit = _build_commit(repo_dir, blobs, site, "origin/gh-pages")
+                if commit is None:
+                    print("  No changes to deploy (feed unchanged)")
+                    return True
+            wait = min(PUSH_BACKOFF_CAP, 2 ** (attempt + 1)) + random.uniform(0, PUSH_BACKOFF_JITTER)
+            print(f"  Push failed, retrying in {wait:.1f}s...")
+            time.sleep(wait)
+
+    print(f"  Push failed after {PUSH_ATTEMPTS} attempts")
+    return False
+
+
+def _git(cmd: list, repo_dir: str, **kwargs) -> str:
+    """Run a git plumbing command and return its output, raising DeployError on failure."""
+    # run() has already printed the command's stderr
+    result = run(cmd, cwd=repo_dir, **kwargs)
+    if result.returncode != 0:
+        raise DeployError(f"{' '.join(cmd[:2])} failed, nothing was deployed")
+    return result.stdout
+
+
+def _tree_entry(name: str, oid: str) -> str:
+    """Format a regular file entry as ls-tree/mktree print it."""
+    return f"100644 blob {oid}\t{name}"
+
+
+def _list_tree(repo_dir: str, ref: str) -> dict:
+    """Map file names at the top of ref's tree to their ls-tree entries."""
+    listing = _git(["git", "ls-tree", "-z", ref], repo_dir)
+    return {
+        line.split("\t", 1)[1]: line
+        for line in listing.split("\0") if line
+    }
+
+
+def _write_blob(repo_dir: str, path: Path = None, data: str = None) -> str:
+    """Store a file or string in the object database and return its ID."""
+    if path is not None:
+        return _git(["git", "hash-object", "-w", str(path.resolve())], repo_dir).strip()
+    return _git(["git", "hash-object", "-w", "--stdin"], repo_dir, input=data).strip()
+
+
+def _build_commit(repo_dir: str, blobs: dict, site: dict, parent: str = None):
+    """
+    Create a gh-pages commit with the given blobs on top of parent.
+
+    Other files already on the branch are kept. Returns the new commit
+    ID, or None if parent already has every blob. Raises DeployError if
+    git fails.
+    """
+    entries = dict(site)
+    for name, oid in blobs.items():
+        entries[name] = _tree_entry(name, oid)
+    if entries == site:
+        return None
+
+    # ls-tree output is already in mktree input format
+    tree = _git(
+        ["git", "mktree", "-z"], repo_dir,
+        input="".join(line + "\0" for line in entries.values())
+    ).strip()
+
+    from datetime import datetime
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+    cmd = ["git", "commit-tree", tree, "-m", f"Update Roku feed - {timestamp}"]
+    if parent:
+        cmd += ["-p", parent]
+    return _git(cmd, repo_dir).strip()
 
 
 def main():
@@ -154,7 +254,8 @@ def main():
     )
 
     args = parser.parse_args()
-    deploy_to_gh_pages(args.feed_path, args.repo_dir)
+    if not deploy_to_gh_pages(args.feed_path, args.repo_dir):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
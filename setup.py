@@ -41,6 +41,7 @@ setup(
     extras_require={
         "s3": ["boto3>=1.26.0"],
         "scheduler": ["schedule>=1.2.0"],
+        "fast": ["orjson>=3.9.0"],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -52,6 +53,7 @@ setup(
         "all": [
             "boto3>=1.26.0",
             "schedule>=1.2.0",
+            "orjson>=3.9.0",
         ],
     },
     entry_points={
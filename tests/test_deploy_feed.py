@@ -0,0 +1,210 @@
+"""
+Tests for the gh-pages deploy script.
+"""
+
+import importlib.util
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "deploy_feed.py"
+
+spec = importlib.util.spec_from_file_location("deploy_feed", SCRIPT)
+deploy_feed = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(deploy_feed)
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def git(*args, cwd):
+    """Run a git command and return its stripped stdout."""
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def make_clone(origin: Path, path: Path) -> Path:
+    """Clone origin with a committer identity configured."""
+    git("clone", "-q", str(origin), str(path), cwd=origin.parent)
+    git("config", "user.email", "deploy@example.com", cwd=path)
+    git("config", "user.name", "Deploy", cwd=path)
+    return path
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create a bare origin and a clone with one commit on main."""
+    origin = tmp_path / "origin.git"
+    git("init", "-q", "--bare", str(origin), cwd=tmp_path)
+    work = make_clone(origin, tmp_path / "work")
+    (work / "README").write_text("hi\n")
+    git("add", "README", cwd=work)
+    git("commit", "-qm", "init", cwd=work)
+    git("push", "-q", "origin", "HEAD:refs/heads/main", cwd=work)
+    return origin, work
+
+
+def published(origin: Path, path: str) -> str:
+    """Read a file from origin's gh-pages branch."""
+    return git("show", f"gh-pages:{path}", cwd=origin)
+
+
+def commit_count(origin: Path) -> int:
+    """Count the commits on origin's gh-pages branch."""
+    return int(git("rev-list", "--count", "gh-pages", cwd=origin))
+
+
+class TestDeployToGhPages:
+    """Tests for deploy_to_gh_pages."""
+
+    def test_first_deploy_creates_branch(self, repo, tmp_path):
+        """Test the first deploy publishes the site files on a new branch."""
+        origin, work = repo
+        feed = tmp_path / "roku_feed.json"
+        feed.write_text('{"a": 1}')
+
+        deploy_feed.deploy_to_gh_pages(str(feed), str(work))
+
+        assert commit_count(origin) == 1
+        assert published(origin, "roku_feed.json") == '{"a": 1}'
+        assert published(origin, "index.html") == deploy_feed.INDEX_HTML
+        assert git("ls-tree", "--name-only", "gh-pages", cwd=origin).split() == [
+            ".nojekyll", "index.html", "roku_feed.json"
+        ]
+
+    def test_unchanged_feed_is_not_committed(self, repo, tmp_path):
+        """Test redeploying the same feed pushes nothing."""
+        origin, work = repo
+        feed = tmp_path / "roku_feed.json"
+        feed.write_text('{"a": 1}')
+
+        deploy_feed.deploy_to_gh_pages(str(feed), str(work))
+        deploy_feed.deploy_to_gh_pages(str(feed), str(work))
+
+        assert commit_count(origin) == 1
+
+    def test_changed_feed_is_committed(self, repo, tmp_path):
+        """Test a changed feed is committed on top of the branch."""
+        origin, work = repo
+        feed = tmp_path / "roku_feed.json"
+        feed.write_text('{"a": 1}')
+        deploy_feed.deploy_to_gh_pages(str(feed), str(work))
+
+        feed.write_text('{"a": 2}')
+        deploy_feed.deploy_to_gh_pages(str(feed), str(work))
+
+        assert commit_count(origin) == 2
+        assert published(origin, "roku_feed.json") == '{"a": 2}'
+
+    def test_work_tree_untouched(self, repo, tmp_path):
+        """Test deploying never switches or dirties the caller's checkout."""
+        origin, work = repo
+        feed = tmp_path / "roku_feed.json"
+        feed.write_text('{"a": 1}')
+        branch = git("branch", "--show-current", cwd=work)
+
+        deploy_feed.deploy_to_gh_pages(str(feed), str(work))
+
+        assert git("branch", "--show-current", cwd=work) == branch
+        assert git("status", "--porcelain", cwd=work) == ""
+
+    def test_rejected_push_rebuilds_on_new_tip(self, repo, tmp_path, monkeypatch):
+        """Test a concurrent push is kept and the deploy retries on top of it."""
+        origin, work = repo
+        feed = tmp_path / "roku_feed.json"
+        feed.write_text('{"a": 1}')
+        deploy_feed.deploy_to_gh_pages(str(feed), str(work))
+
+        other = make_clone(origin, tmp_path / "other")
+        git("checkout", "-q", "gh-pages", cwd=other)
+        (other / "extra.txt").write_text("x\n")
+        git("add", "extra.txt", cwd=other)
+        git("commit", "-qm", "extra", cwd=other)
+
+        # Land the other push just before this deploy's first push
+        real_run = deploy_feed.run
+        pushes = []
+
+        def racing_run(cmd, **kwargs):
+            if cmd[:2] == ["git", "push"] and not pushes:
+                git("push", "-q", "origin", "gh-pages", cwd=other)
+            if cmd[:2] == ["git", "push"]:
+                pushes.append(cmd)
+            return real_run(cmd, **kwargs)
+
+        monkeypatch.setattr(deploy_feed, "run", racing_run)
+        monkeypatch.setattr(deploy_feed.time, "sleep", lambda s: None)
+
+        feed.write_text('{"a": 2}')
+        deploy_feed.deploy_to_gh_pages(str(feed), str(work))
+
+        assert len(pushes) == 2
+        assert commit_count(origin) == 3
+        assert published(origin, "roku_feed.json") == '{"a": 2}'
+        assert published(origin, "extra.txt") == "x"
+
+    def test_push_failure_reported(self, repo, tmp_path, monkeypatch):
+        """Test a push that keeps failing returns False and exits non-zero."""
+        origin, work = repo
+        hook = origin / "hooks" / "pre-receive"
+        hook.write_text("#!/bin/sh\nexit 1\n")
+        hook.chmod(0o755)
+        feed = tmp_path / "roku_feed.json"
+        feed.write_text('{"a": 1}')
+        monkeypatch.setattr(deploy_feed.time, "sleep", lambda s: None)
+
+        assert deploy_feed.deploy_to_gh_pages(str(feed), str(work)) is False
+
+        monkeypatch.setattr(
+            "sys.argv", ["deploy_feed.py", "--feed-path", str(feed), "--repo-dir", str(work)]
+        )
+        with pytest.raises(SystemExit) as exc:
+            deploy_feed.main()
+        assert exc.value.code == 1
+
+    def test_missing_feed_reported(self, repo, tmp_path):
+        """Test a missing feed file returns False."""
+        origin, work = repo
+
+        assert deploy_feed.deploy_to_gh_pages(str(tmp_path / "missing.json"), str(work)) is False
+
+    def test_git_failure_is_not_reported_unchanged(self, repo, tmp_path, monkeypatch, capsys):
+        """Test a failing plumbing step fails the deploy instead of skipping it."""
+        origin, work = repo
+        feed = tmp_path / "roku_feed.json"
+        feed.write_text('{"a": 1}')
+        real_run = deploy_feed.run
+
+        def failing_mktree(cmd, **kwargs):
+            if cmd[:2] == ["git", "mktree"]:
+                return subprocess.CompletedProcess(cmd, 128, "", "fatal: broken")
+            return real_run(cmd, **kwargs)
+
+        monkeypatch.setattr(deploy_feed, "run", failing_mktree)
+
+        assert deploy_feed.deploy_to_gh_pages(str(feed), str(work)) is False
+        out = capsys.readouterr().out
+        assert "git mktree failed" in out
+        assert "feed unchanged" not in out
+
+    def test_single_branch_clone(self, repo, tmp_path):
+        """Test deploying from a clone whose fetch refspec excludes gh-pages."""
+        origin, work = repo
+        feed = tmp_path / "roku_feed.json"
+        feed.write_text('{"a": 1}')
+        deploy_feed.deploy_to_gh_pages(str(feed), str(work))
+
+        single = tmp_path / "single"
+        git("clone", "-q", "--single-branch", "-b", "main", str(origin), str(single), cwd=tmp_path)
+        git("config", "user.email", "deploy@example.com", cwd=single)
+        git("config", "user.name", "Deploy", cwd=single)
+
+        assert deploy_feed.deploy_to_gh_pages(str(feed), str(single)) is True
+        assert commit_count(origin) == 1
+
+        feed.write_text('{"a": 2}')
+        assert deploy_feed.deploy_to_gh_pages(str(feed), str(single)) is True
+        assert commit_count(origin) == 2
+        assert published(origin, "roku_feed.json") == '{"a": 2}'
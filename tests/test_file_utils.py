@@ -0,0 +1,96 @@
+"""
+Tests for the atomic file helpers.
+"""
+
+import errno
+import os
+import stat
+
+import pytest
+
+from vimeo_roku_sdk import file_utils
+from vimeo_roku_sdk.file_utils import atomic_write, atomic_link
+
+
+def mode(path) -> int:
+    """Get a file's permission bits."""
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+class TestAtomicWrite:
+    """Tests for atomic_write."""
+
+    def test_write_new_file(self, tmp_path):
+        """Test a new file gets the default mode and no temp file is left."""
+        path = tmp_path / "feed.json"
+
+        atomic_write(path, b"{}")
+
+        assert path.read_bytes() == b"{}"
+        assert mode(path) == file_utils.DEFAULT_FILE_MODE
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_keeps_existing_mode(self, tmp_path):
+        """Test replacing a file keeps its permission bits."""
+        path = tmp_path / "state.json"
+        path.write_bytes(b"old")
+        os.chmod(path, 0o600)
+
+        atomic_write(path, b"new")
+
+        assert path.read_bytes() == b"new"
+        assert mode(path) == 0o600
+
+    def test_other_writers_temp_untouched(self, tmp_path):
+        """Test a concurrent writer's temp file is not reused or clobbered."""
+        path = tmp_path / "feed.json"
+        other_tmp = tmp_path / "feed.json.tmp"
+        other_tmp.write_bytes(b"partial")
+
+        atomic_write(path, b"{}")
+
+        assert other_tmp.read_bytes() == b"partial"
+
+    def test_failed_write_cleans_up(self, tmp_path):
+        """Test a failed write leaves the target and no temp file behind."""
+        path = tmp_path / "feed.json"
+        path.write_bytes(b"old")
+
+        with pytest.raises(TypeError):
+            atomic_write(path, "not bytes")
+
+        assert path.read_bytes() == b"old"
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestAtomicLink:
+    """Tests for atomic_link."""
+
+    def test_hard_links_on_same_filesystem(self, tmp_path):
+        """Test the copy shares the source's inode."""
+        src = tmp_path / "roku_feed.json"
+        src.write_bytes(b"{}")
+        dest = tmp_path / "cached_feed.json"
+        dest.write_bytes(b"old")
+
+        atomic_link(src, dest)
+
+        assert os.path.samefile(src, dest)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["cached_feed.json", "roku_feed.json"]
+
+    def test_copies_across_filesystems(self, tmp_path, monkeypatch):
+        """Test a copy is made when hard-linking fails."""
+        src = tmp_path / "roku_feed.json"
+        src.write_bytes(b"{}")
+        dest = tmp_path / "cached_feed.json"
+
+        def cross_device(*args):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(file_utils.os, "link", cross_device)
+
+        atomic_link(src, dest)
+
+        assert dest.read_bytes() == b"{}"
+        assert not os.path.samefile(src, dest)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["cached_feed.json", "roku_feed.json"]
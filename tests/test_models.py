@@ -209,3 +209,14 @@ class TestRokuFeed:
 
         assert "Test Provider" in json_str
         assert "providerName" in json_str
+
+    def test_save_replaces_file(self, tmp_path):
+        """Test saving overwrites the feed and leaves no temp file."""
+        path = tmp_path / "roku_feed.json"
+        path.write_text("old")
+        feed = RokuFeed(provider_name="Test Provider")
+
+        feed.save(str(path))
+
+        assert "Test Provider" in path.read_text(encoding="utf-8")
+        assert list(tmp_path.iterdir()) == [path]
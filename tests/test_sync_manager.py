@@ -0,0 +1,129 @@
+"""
+Tests for the sync manager.
+"""
+
+from datetime import datetime
+
+from vimeo_roku_sdk.config import Config, VimeoConfig, RokuConfig, SyncConfig
+from vimeo_roku_sdk.models import Video, VideoFile, VideoQuality
+from vimeo_roku_sdk.sync_manager import SyncManager, SyncState, VideoCache
+
+
+def make_manager(**sync_kwargs) -> SyncManager:
+    """Create a SyncManager with caching disabled."""
+    config = Config(
+        vimeo=VimeoConfig(access_token="test_token"),
+        roku=RokuConfig(provider_name="Test Channel"),
+        sync=SyncConfig(cache_enabled=False, **sync_kwargs)
+    )
+    return SyncManager(config=config)
+
+
+def make_video(tags=None) -> Video:
+    """Create a playable public video."""
+    return Video(
+        id="123",
+        title="Test",
+        description="",
+        duration=100,
+        created_time=datetime.now(),
+        modified_time=datetime.now(),
+        tags=tags or [],
+        video_files=[
+            VideoFile(url="https://example.com/v.m3u8", quality=VideoQuality.HD)
+        ]
+    )
+
+
+class TestShouldIncludeVideo:
+    """Tests for SyncManager._should_include_video."""
+
+    def test_include_tags_case_insensitive(self):
+        """Test include tags match regardless of case."""
+        manager = make_manager(include_tags=["Featured"])
+
+        assert manager._should_include_video(make_video(tags=["FEATURED"]))
+        assert not manager._should_include_video(make_video(tags=["other"]))
+
+    def test_exclude_tags_case_insensitive(self):
+        """Test exclude tags match regardless of case."""
+        manager = make_manager(exclude_tags=["Draft"])
+
+        assert not manager._should_include_video(make_video(tags=["draft"]))
+        assert manager._should_include_video(make_video(tags=["final"]))
+
+    def test_no_tag_filters(self):
+        """Test videos pass when no tag filters are configured."""
+        manager = make_manager()
+
+        assert manager._should_include_video(make_video())
+
+    def test_none_tag_filters(self):
+        """Test empty YAML tag keys (loaded as None) disable filtering."""
+        manager = make_manager(include_tags=None, exclude_tags=None)
+
+        assert manager._should_include_video(make_video(tags=["any"]))
+
+
+class TestVideoCache:
+    """Tests for VideoCache persistence."""
+
+    def test_save_and_reload(self, tmp_path):
+        """Test cache entries survive a save/load round trip."""
+        video = make_video()
+        cache = VideoCache(str(tmp_path))
+        cache.update(video, {"id": "vimeo-123", "title": "Café"})
+        cache.save()
+
+        reloaded = VideoCache(str(tmp_path))
+
+        assert not reloaded.is_changed(video)
+        assert reloaded.get_cached_roku_data("123")["title"] == "Café"
+
+    def test_corrupt_cache_is_ignored(self, tmp_path):
+        """Test an unreadable cache file starts an empty cache."""
+        (tmp_path / "video_cache.json").write_text("{not json")
+
+        cache = VideoCache(str(tmp_path))
+
+        assert cache.get_all_ids() == set()
+
+    def test_save_feed_file(self, tmp_path):
+        """Test a saved feed file is kept and survives the feed being rewritten."""
+        feed_path = tmp_path / "roku_feed.json"
+        feed_path.write_text('{"version": 1}')
+        cache = VideoCache(str(tmp_path / "cache"))
+
+        cache.save_feed_file(str(feed_path))
+        feed_path.unlink()
+        feed_path.write_text('{"version": 2}')
+
+        assert cache.get_cached_feed() == '{"version": 1}'
+
+
+class TestSyncState:
+    """Tests for SyncState persistence."""
+
+    def test_save_and_load(self, tmp_path):
+        """Test state survives a save/load round trip."""
+        path = tmp_path / "state" / "sync_state.json"
+        state = SyncState(
+            last_sync=datetime(2025, 1, 2, 3, 4, 5),
+            last_video_count=7,
+            synced_video_ids=["1", "2"]
+        )
+        state.save(str(path))
+
+        loaded = SyncState.load(str(path))
+
+        assert loaded.last_sync == datetime(2025, 1, 2, 3, 4, 5)
+        assert loaded.last_video_count == 7
+        assert loaded.synced_video_ids == ["1", "2"]
+        assert list(path.parent.iterdir()) == [path]
+
+    def test_load_missing_file(self, tmp_path):
+        """Test loading a missing state file returns empty state."""
+        state = SyncState.load(str(tmp_path / "missing.json"))
+
+        assert state.last_sync is None
+        assert state.synced_video_ids == []
@@ -0,0 +1,178 @@
+"""
+Tests for the Vimeo API client.
+"""
+
+import json
+import pytest
+
+from vimeo_roku_sdk.vimeo_client import VimeoClient
+from vimeo_roku_sdk.exceptions import VimeoAPIError
+
+
+def make_page(page: int, total: int, per_page: int = 100):
+    """Build a fake Vimeo list response for the given page."""
+    start = (page - 1) * per_page
+    count = max(0, min(per_page, total - start))
+    return {
+        "total": total,
+        "data": [
+            {"uri": f"/videos/{start + i + 1}", "name": f"Video {start + i + 1}"}
+            for i in range(count)
+        ]
+    }
+
+
+class TestFolderVideos:
+    """Tests for concurrent folder fetching."""
+
+    def test_get_all_folder_videos_fast_in_page_order(self, monkeypatch):
+        """Test all pages are fetched and returned in page order."""
+        client = VimeoClient(access_token="test_token")
+        monkeypatch.setattr(
+            client, "_fetch_page",
+            lambda endpoint, page, per_page=100, *args, **kwargs: make_page(page, 250)
+        )
+
+        videos = client.get_all_folder_videos_fast(folder_id="42")
+
+        assert [v.id for v in videos] == [str(i) for i in range(1, 251)]
+
+    def test_get_all_folder_videos_fast_limit(self, monkeypatch):
+        """Test limit stops fetching and truncates results."""
+        client = VimeoClient(access_token="test_token")
+        pages = []
+
+        def fake_fetch(endpoint, page, per_page=100, *args, **kwargs):
+            pages.append(page)
+            return make_page(page, 1000)
+
+        monkeypatch.setattr(client, "_fetch_page", fake_fetch)
+
+        videos = client.get_all_folder_videos_fast(folder_id="42", limit=150)
+
+        assert len(videos) == 150
+        assert sorted(pages) == [1, 2]
+
+    def test_failed_page_raises(self, monkeypatch):
+        """Test a page that fails after retries fails the whole fetch."""
+        client = VimeoClient(access_token="test_token")
+
+        def fake_fetch(endpoint, page, per_page=100, *args, **kwargs):
+            if page == 2:
+                raise VimeoAPIError("Request failed after 3 attempts")
+            return make_page(page, 300)
+
+        monkeypatch.setattr(client, "_fetch_page", fake_fetch)
+
+        with pytest.raises(VimeoAPIError, match="pages: 2"):
+            client.get_all_folder_videos_fast(folder_id="42")
+
+    def test_folder_id_required(self):
+        """Test a folder ID is required."""
+        client = VimeoClient(access_token="test_token")
+
+        with pytest.raises(VimeoAPIError):
+            client.get_all_folder_videos_fast()
+
+
+class TestAllPages:
+    """Tests for concurrent fetching shared by the user and album sources."""
+
+    def fail_page_two(self, endpoint, page, per_page=100, *args, **kwargs):
+        """Fake _fetch_page where page 2 fails after retries."""
+        if page == 2:
+            raise VimeoAPIError("Request failed after 3 attempts")
+        return make_page(page, 300)
+
+    def test_user_videos_failed_page_raises(self, monkeypatch):
+        """Test a failed page fails get_all_videos_fast."""
+        client = VimeoClient(access_token="test_token")
+        monkeypatch.setattr(client, "_fetch_page", self.fail_page_two)
+
+        with pytest.raises(VimeoAPIError, match="pages: 2"):
+            client.get_all_videos_fast()
+
+    def test_album_videos_failed_page_raises(self, monkeypatch):
+        """Test a failed page fails get_all_album_videos_fast."""
+        client = VimeoClient(access_token="test_token")
+        monkeypatch.setattr(client, "_fetch_page", self.fail_page_two)
+
+        with pytest.raises(VimeoAPIError, match="pages: 2"):
+            client.get_all_album_videos_fast(album_id="7")
+
+    def test_progress_reported_per_page(self, monkeypatch):
+        """Test on_progress is called once per fetched page."""
+        client = VimeoClient(access_token="test_token")
+        monkeypatch.setattr(
+            client, "_fetch_page",
+            lambda endpoint, page, per_page=100, *args, **kwargs: make_page(page, 250)
+        )
+        progress = []
+
+        videos = client.get_all_videos_fast(on_progress=lambda done, total: progress.append((done, total)))
+
+        assert len(videos) == 250
+        assert sorted(progress) == [(1, 3), (2, 3), (3, 3)]
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code: int, body: str = "{}", headers: dict = None):
+        self.status_code = status_code
+        self.text = body
+        self.content = body.encode()
+        self.headers = headers or {}
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class TestRetry:
+    """Tests for request retry behavior."""
+
+    def test_rate_limit_waits_at_least_retry_after(self, monkeypatch):
+        """Test a 429 waits no less than Retry-After before retrying."""
+        client = VimeoClient(access_token="test_token")
+        responses = [
+            FakeResponse(429, headers={"Retry-After": "5"}),
+            FakeResponse(200, '{"name": "ok"}')
+        ]
+        sleeps = []
+        monkeypatch.setattr(client.session, "request", lambda **kwargs: responses.pop(0))
+        monkeypatch.setattr("vimeo_roku_sdk.vimeo_client.time.sleep", sleeps.append)
+
+        result = client._make_request("GET", "/me")
+
+        assert result == {"name": "ok"}
+        assert len(sleeps) == 1
+        assert 5 <= sleeps[0] <= 6
+
+    def test_non_json_success_retried(self, monkeypatch):
+        """Test a 2xx non-JSON body is retried, then raises VimeoAPIError."""
+        client = VimeoClient(access_token="test_token")
+        calls = []
+
+        def fake_request(**kwargs):
+            calls.append(kwargs)
+            return FakeResponse(200, "<html>Bad Gateway</html>")
+
+        monkeypatch.setattr(client.session, "request", fake_request)
+        monkeypatch.setattr("vimeo_roku_sdk.vimeo_client.time.sleep", lambda s: None)
+
+        with pytest.raises(VimeoAPIError):
+            client._make_request("GET", "/me", retry_count=3)
+
+        assert len(calls) == 3
+
+
+class TestSession:
+    """Tests for HTTP session setup."""
+
+    def test_pool_sized_to_workers(self):
+        """Test the connection pool holds one connection per worker."""
+        client = VimeoClient(access_token="test_token", max_workers=12)
+
+        adapter = client.session.get_adapter(client.BASE_URL)
+
+        assert adapter._pool_maxsize == 12
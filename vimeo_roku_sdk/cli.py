@@ -7,12 +7,10 @@ import logging
 import sys
 import os
 from pathlib import Path
-from datetime import datetime
 
 from .config import Config
-from .sync_manager import SyncManager, create_sync_manager
+from .sync_manager import SyncManager
 from .vimeo_client import VimeoClient
-from .roku_feed import RokuFeedGenerator
 
 
 def setup_logging(level: str = "INFO", log_file: str = None):
@@ -0,0 +1,97 @@
+"""
+File helpers shared by the feed, cache and sync state writers.
+
+Every write goes to a uniquely named temp file in the target directory
+and is renamed into place, so concurrent writers (e.g. the daily_sync
+scheduler and a manual sync) never share a temp file, and readers never
+see a partial file.
+"""
+
+import os
+import secrets
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Union
+
+# Mode for newly created files: what open() gives under the usual 022 umask
+DEFAULT_FILE_MODE = 0o644
+
+
+def _target_mode(path: Path) -> int:
+    """Get the permission bits a replacement for path should keep."""
+    try:
+        return path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        return DEFAULT_FILE_MODE
+
+
+def _replace(tmp_path: Path, path: Path):
+    """Rename tmp_path over path, removing tmp_path if that fails."""
+    try:
+        os.replace(tmp_path, path)
+    except BaseException:
+        _unlink_quietly(tmp_path)
+        raise
+
+
+def _unlink_quietly(path: Path):
+    """Remove a leftover temp file, ignoring it if already gone."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _temp_file(path: Path) -> Path:
+    """Create an empty, uniquely named temp file next to path."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    os.close(fd)
+    return Path(tmp_name)
+
+
+def atomic_write(path: Union[str, Path], data: bytes):
+    """Write a file via a unique temp file and rename it into place."""
+    path = Path(path)
+    tmp_path = _temp_file(path)
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, _target_mode(path))
+    except BaseException:
+        _unlink_quietly(tmp_path)
+        raise
+    _replace(tmp_path, path)
+
+
+def atomic_link(src: Union[str, Path], path: Union[str, Path]):
+    """
+    Put a copy of src at path atomically.
+
+    Hard-links src when both are on the same filesystem, so no bytes are
+    copied; otherwise falls back to copying it.
+    """
+    path = Path(path)
+    try:
+        tmp_path = _link_to_fresh_name(src, path)
+    except OSError:
+        # Cross-device or no hard link support
+        tmp_path = _temp_file(path)
+        try:
+            shutil.copy2(src, tmp_path)
+        except BaseException:
+            _unlink_quietly(tmp_path)
+            raise
+    _replace(tmp_path, path)
+
+
+def _link_to_fresh_name(src: Union[str, Path], path: Path) -> Path:
+    """Hard-link src to a new unique name next to path."""
+    # os.link can't target an existing file, so mkstemp's name can't be reused
+    while True:
+        tmp_path = path.with_name(f"{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            os.link(src, tmp_path)
+            return tmp_path
+        except FileExistsError:
+            continue
@@ -0,0 +1,37 @@
+"""
+JSON encoding helpers with an optional orjson fast path.
+
+orjson is used when installed (pip install vimeo-roku-sdk[fast]);
+otherwise the standard library json module is used.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Encode an object as UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to encode
+        indent: Pretty-print with two-space indentation instead of
+            compact output
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
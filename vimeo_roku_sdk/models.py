@@ -8,6 +8,8 @@ from typing import Optional, List, Dict, Any
 from enum import Enum
 import json
 
+from .file_utils import atomic_write
+
 
 class VideoType(Enum):
     """Video content types supported by Roku."""
@@ -26,6 +28,10 @@ class VideoQuality(Enum):
     UHD = "UHD"
 
 
+# Preferred order when picking a non-HLS file, best first
+QUALITY_PREFERENCE = (VideoQuality.UHD, VideoQuality.FHD, VideoQuality.HD, VideoQuality.SD)
+
+
 @dataclass
 class VideoFile:
     """Represents a video file with quality and URL information."""
@@ -202,8 +208,7 @@ class Video:
             return hls_files[0]
 
         if self.video_files:
-            quality_order = [VideoQuality.UHD, VideoQuality.FHD, VideoQuality.HD, VideoQuality.SD]
-            for quality in quality_order:
+            for quality in QUALITY_PREFERENCE:
                 for file in self.video_files:
                     if file.quality == quality:
                         return file
@@ -228,7 +233,7 @@ class RokuVideo:
     rating: Optional[Dict[str, str]] = None
 
     # Roku-approved genres
-    VALID_GENRES = {
+    VALID_GENRES = frozenset({
         "action", "adventure", "animals", "animated", "anime",
         "children", "comedy", "crime", "documentary", "drama",
         "educational", "fantasy", "faith", "food", "fashion",
@@ -236,7 +241,7 @@ class RokuVideo:
         "mystery", "nature", "news", "reality", "romance",
         "science", "science fiction", "sitcom", "special",
         "sports", "thriller", "technology"
-    }
+    })
 
     # Map common Vimeo categories to Roku genres
     GENRE_MAP = {
@@ -277,7 +282,7 @@ class RokuVideo:
     }
 
     # Valid Roku video types
-    VALID_VIDEO_TYPES = {"HLS", "SMOOTH", "DASH", "MP4", "MOV", "M4V"}
+    VALID_VIDEO_TYPES = frozenset({"HLS", "SMOOTH", "DASH", "MP4", "MOV", "M4V"})
 
     @classmethod
     def _map_genre(cls, category: str) -> str:
@@ -467,6 +472,10 @@ class RokuFeed:
         return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
 
     def save(self, filepath: str):
-        """Save feed to a JSON file."""
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(self.to_json())
+        """
+        Save feed to a JSON file.
+
+        The feed is written to a temp file next to the target and renamed
+        into place, so a deploy or Roku fetch never sees a partial feed.
+        """
+        atomic_write(filepath, self.to_json().encode("utf-8"))
@@ -2,15 +2,16 @@
 Roku Direct Publisher feed generator.
 """
 
-import json
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any
 from pathlib import Path
 
+import requests
+
 from .models import Video, RokuVideo, RokuFeed, VideoType
 from .config import RokuConfig
-from .exceptions import RokuFeedError, RokuValidationError
+from .exceptions import RokuFeedError
 
 logger = logging.getLogger(__name__)
 
@@ -436,8 +437,6 @@ class RokuFeedUploader:
         Returns:
             True if notification was successful
         """
-        import requests
-
         webhook_url = webhook_url or self.config.webhook_url
         if not webhook_url:
             return False
@@ -8,6 +8,7 @@ Optimized for speed with:
 """
 
 import json
+import time
 import hashlib
 import logging
 from datetime import datetime
@@ -15,11 +16,13 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional, Callable
 from dataclasses import dataclass, field
 
+from . import json_compat
+from .file_utils import atomic_write, atomic_link
 from .vimeo_client import VimeoClient
 from .roku_feed import RokuFeedGenerator, RokuFeedUploader
 from .models import Video, RokuVideo, VideoType
 from .config import Config, VimeoConfig, RokuConfig, SyncConfig
-from .exceptions import SyncError, VimeoAPIError, RokuFeedError
+from .exceptions import VimeoAPIError, RokuFeedError
 
 logger = logging.getLogger(__name__)
 
@@ -74,16 +77,14 @@ class VideoCache:
         self._load()
 
     def _load(self):
-        if self._cache_file.exists():
-            try:
-                with open(self._cache_file, "r") as f:
-                    self._data = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                self._data = {}
+        try:
+            with open(self._cache_file, "rb") as f:
+                self._data = json_compat.loads(f.read())
+        except (json.JSONDecodeError, IOError):
+            self._data = {}
 
     def save(self):
-        with open(self._cache_file, "w") as f:
-            json.dump(self._data, f)
+        atomic_write(self._cache_file, json_compat.dumps(self._data))
 
     @staticmethod
     def _video_hash(video: Video) -> str:
@@ -98,13 +99,21 @@ class VideoCache:
             return True
         return cached.get("hash") != self._video_hash(video)
 
-    def update(self, video: Video, roku_video_dict: Dict[str, Any]):
-        """Update cache entry for a video."""
+    def update(self, video: Video, roku_video_dict: Dict[str, Any], cached_at: str = None):
+        """
+        Update cache entry for a video.
+
+        Args:
+            video: Source video
+            roku_video_dict: Roku feed data for the video
+            cached_at: ISO timestamp to record; pass one shared value when
+                updating many entries in a single sync
+        """
         self._data[video.id] = {
             "hash": self._video_hash(video),
             "roku_data": roku_video_dict,
             "video_type": "short_form" if video.duration < 900 else "movie",
-            "cached_at": datetime.now().isoformat()
+            "cached_at": cached_at or datetime.now().isoformat()
         }
 
     def get_cached_roku_data(self, video_id: str) -> Optional[Dict[str, Any]]:
@@ -129,17 +138,23 @@ class VideoCache:
         """Get all cached video IDs."""
         return set(self._data.keys())
 
-    def save_feed(self, feed_json: str):
-        """Save a copy of the generated feed for fast rebuilds."""
-        with open(self._feed_cache_file, "w") as f:
-            f.write(feed_json)
+    def save_feed_file(self, feed_path: str):
+        """
+        Save a copy of an already written feed file for fast rebuilds.
+
+        Hard-links the file when the cache is on the same filesystem, so
+        the feed isn't serialized or written a second time. RokuFeed.save
+        replaces the feed with a new file, so the link keeps this version.
+        """
+        atomic_link(feed_path, self._feed_cache_file)
 
     def get_cached_feed(self) -> Optional[str]:
         """Get the cached feed JSON."""
-        if self._feed_cache_file.exists():
+        try:
             with open(self._feed_cache_file, "r") as f:
                 return f.read()
-        return None
+        except FileNotFoundError:
+            return None
 
     def clear(self):
         self._data = {}
@@ -158,17 +173,16 @@ class SyncState:
 
     @classmethod
     def load(cls, filepath: str) -> "SyncState":
-        path = Path(filepath)
-        if not path.exists():
-            return cls()
         try:
-            with open(path, "r") as f:
-                data = json.load(f)
+            with open(filepath, "rb") as f:
+                data = json_compat.loads(f.read())
             return cls(
                 last_sync=datetime.fromisoformat(data["last_sync"]) if data.get("last_sync") else None,
                 last_video_count=data.get("last_video_count", 0),
                 synced_video_ids=data.get("synced_video_ids", [])
             )
+        except FileNotFoundError:
+            return cls()
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             logger.warning(f"Failed to load sync state: {e}")
             return cls()
@@ -181,8 +195,7 @@ class SyncState:
             "last_video_count": self.last_video_count,
             "synced_video_ids": self.synced_video_ids
         }
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+        atomic_write(path, json_compat.dumps(data, indent=True))
 
 
 class SyncManager:
@@ -213,6 +226,11 @@ class SyncManager:
         # Video cache for fast daily syncs
         self._cache = VideoCache(self.config.sync.cache_path) if self.config.sync.cache_enabled else None
 
+        # Tag filters are case-insensitive; normalize them once, not per video.
+        # An empty YAML key (include_tags:) loads as None.
+        self._include_tags = frozenset(t.lower() for t in self.config.sync.include_tags or ())
+        self._exclude_tags = frozenset(t.lower() for t in self.config.sync.exclude_tags or ())
+
         self._on_video_processed: Optional[Callable[[Video, bool], None]] = None
         self._on_progress: Optional[Callable[[int, int], None]] = None
 
@@ -243,15 +261,11 @@ class SyncManager:
             return False
         if self.config.sync.max_duration and video.duration > self.config.sync.max_duration:
             return False
-        if self.config.sync.include_tags:
-            video_tags = [t.lower() for t in video.tags]
-            include_tags = [t.lower() for t in self.config.sync.include_tags]
-            if not any(tag in video_tags for tag in include_tags):
+        if self._include_tags or self._exclude_tags:
+            video_tags = {t.lower() for t in video.tags}
+            if self._include_tags and self._include_tags.isdisjoint(video_tags):
                 return False
-        if self.config.sync.exclude_tags:
-            video_tags = [t.lower() for t in video.tags]
-            exclude_tags = [t.lower() for t in self.config.sync.exclude_tags]
-            if any(tag in video_tags for tag in exclude_tags):
+            if not self._exclude_tags.isdisjoint(video_tags):
                 return False
         if not video.get_best_video_file():
             return False
@@ -278,12 +292,8 @@ class SyncManager:
             album_id = album_id or self.config.vimeo.album_id
             videos = self.vimeo.get_all_album_videos_fast(album_id=album_id)
         elif source == "folder":
-            videos = []
             folder_id = folder_id or self.config.vimeo.folder_id
-            for video in self.vimeo.iter_folder_videos(folder_id=folder_id):
-                videos.append(video)
-                if limit and len(videos) >= limit:
-                    break
+            videos = self.vimeo.get_all_folder_videos_fast(folder_id=folder_id, limit=limit)
         else:
             videos = self.vimeo.get_all_videos_fast(limit=limit, on_progress=page_progress)
 
@@ -306,6 +316,7 @@ class SyncManager:
         Unchanged videos use cached Roku feed data directly.
         """
         start_time = datetime.now()
+        start_clock = time.monotonic()
         result = SyncResult(success=False)
 
         try:
@@ -323,6 +334,7 @@ class SyncManager:
             logger.info(f"Processing {total_videos} videos...")
 
             current_ids = set()
+            cached_at = start_time.isoformat()
 
             for idx, video in enumerate(videos):
                 result.videos_processed += 1
@@ -361,12 +373,11 @@ class SyncManager:
 
                     # Process changed/new video
                     video_type = self._determine_video_type(video)
-                    roku_video = RokuVideo.from_video(video, video_type)
-                    self.feed_generator.add_video(video, video_type)
+                    roku_video = self.feed_generator.add_video(video, video_type)
 
                     # Update cache
                     if self._cache:
-                        self._cache.update(video, roku_video.to_dict())
+                        self._cache.update(video, roku_video.to_dict(), cached_at)
 
                     if self._cache and self._cache.get_cached_roku_data(video.id):
                         result.videos_updated += 1
@@ -395,7 +406,7 @@ class SyncManager:
             # Save cache
             if self._cache:
                 self._cache.save()
-                self._cache.save_feed(self.feed_generator.feed.to_json())
+                self._cache.save_feed_file(feed_path)
 
             # Upload to S3 if requested
             if upload and self.config.roku.s3_bucket:
@@ -434,7 +445,7 @@ class SyncManager:
             result.errors.append(f"Unexpected: {str(e)}")
 
         finally:
-            result.duration_seconds = (datetime.now() - start_time).total_seconds()
+            result.duration_seconds = time.monotonic() - start_clock
 
         return result
 
@@ -3,12 +3,15 @@ Vimeo API client for fetching video content.
 """
 
 import time
+import random
 import logging
-from typing import Optional, List, Dict, Any, Generator
+from typing import List, Dict, Any, Generator
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
+from requests.adapters import HTTPAdapter
 
+from . import json_compat
 from .models import Video
 from .config import VimeoConfig
 from .exceptions import (
@@ -39,6 +42,8 @@ class VimeoClient:
     BASE_URL = "https://api.vimeo.com"
     DEFAULT_PER_PAGE = 100  # Vimeo's max per page
     MAX_WORKERS = 6  # Concurrent API requests
+    MAX_BACKOFF = 30  # Cap on retry backoff for failed requests (seconds)
+    TIMEOUT = (10, 30)  # (connect, read) timeouts in seconds
 
     def __init__(
         self,
@@ -66,6 +71,8 @@ class VimeoClient:
         if not self.access_token:
             raise VimeoAuthError("Access token is required")
 
+        self._max_workers = max_workers or self.MAX_WORKERS
+
         self.session = requests.Session()
         self.session.headers.update({
             "Authorization": f"Bearer {self.access_token}",
@@ -73,7 +80,15 @@ class VimeoClient:
             "Accept": "application/vnd.vimeo.*+json;version=3.4"
         })
 
-        self._max_workers = max_workers or self.MAX_WORKERS
+        # Keep one pooled keep-alive connection per worker thread so
+        # concurrent page fetches never have to reconnect; retries are
+        # handled in _make_request
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self._max_workers,
+            max_retries=0
+        )
+        self.session.mount("https://", adapter)
 
     def _make_request(
         self,
@@ -93,14 +108,17 @@ class VimeoClient:
                     url=url,
                     params=params,
                     json=data,
-                    timeout=30
+                    timeout=self.TIMEOUT
                 )
 
                 if response.status_code == 429:
                     retry_after = int(response.headers.get("Retry-After", 60))
                     if attempt < retry_count - 1:
-                        logger.warning(f"Rate limited, waiting {retry_after}s...")
-                        time.sleep(retry_after)
+                        # Retry-After is a floor; jitter stops concurrent page
+                        # fetches from retrying in lockstep
+                        wait_time = retry_after + random.uniform(0, attempt + 1)
+                        logger.warning(f"Rate limited, waiting {wait_time:.1f}s...")
+                        time.sleep(wait_time)
                         continue
                     raise VimeoRateLimitError(
                         "Rate limit exceeded",
@@ -120,15 +138,23 @@ class VimeoClient:
                         response=response.json() if response.text else None
                     )
 
-                return response.json() if response.text else {}
+                try:
+                    return json_compat.loads(response.content) if response.content else {}
+                except ValueError as e:
+                    # Non-JSON success body (e.g. a proxy error page); retry
+                    # it like a failed request
+                    error = e
 
             except requests.exceptions.RequestException as e:
-                if attempt < retry_count - 1:
-                    wait_time = 2 ** attempt
-                    logger.warning(f"Request failed, retrying in {wait_time}s: {e}")
-                    time.sleep(wait_time)
-                    continue
-                raise VimeoAPIError(f"Request failed after {retry_count} attempts: {e}")
+                error = e
+
+            if attempt < retry_count - 1:
+                # Full-jitter exponential backoff, capped
+                wait_time = random.uniform(0, min(self.MAX_BACKOFF, 2 ** (attempt + 1)))
+                logger.warning(f"Request failed, retrying in {wait_time:.1f}s: {error}")
+                time.sleep(wait_time)
+                continue
+            raise VimeoAPIError(f"Request failed after {retry_count} attempts: {error}")
 
     def _get_endpoint(self, user_id: str = None, suffix: str = "") -> str:
         """Build the correct API endpoint for user resources."""
@@ -174,56 +200,37 @@ class VimeoClient:
 
         return self._make_request("GET", endpoint, params=params)
 
-    def get_videos(
+    def _fetch_all_pages(
         self,
-        user_id: str = None,
-        per_page: int = None,
-        page: int = 1,
-        sort: str = "date",
-        direction: str = "desc",
-        filter_playable: bool = True
-    ) -> Dict[str, Any]:
-        """Get videos for a user (single page)."""
-        per_page = min(per_page or self.DEFAULT_PER_PAGE, 100)
-        endpoint = self._get_endpoint(user_id, "/videos")
-        return self._fetch_page(endpoint, page, per_page, sort, direction, filter_playable)
-
-    def get_all_videos_fast(
-        self,
-        user_id: str = None,
-        sort: str = "date",
-        direction: str = "desc",
-        filter_playable: bool = True,
+        endpoint: str,
         limit: int = None,
-        on_progress: callable = None
+        on_progress: callable = None,
+        **page_kwargs
     ) -> List[Video]:
         """
-        Fetch all videos using concurrent page requests.
+        Fetch every page of a video list endpoint concurrently.
 
         Fetches page 1 first to determine total pages, then fetches
-        all remaining pages in parallel using a thread pool.
+        all remaining pages in parallel using a thread pool. A page that
+        still fails after retries raises instead of being dropped, since
+        a missing page would silently truncate the feed.
 
         Args:
-            user_id: User ID
-            sort: Sort field
-            direction: Sort direction
-            filter_playable: Only return playable videos
+            endpoint: List endpoint to page through
             limit: Maximum number of videos to return
             on_progress: Callback(pages_done, total_pages)
+            **page_kwargs: Extra arguments for _fetch_page (sort, etc.)
 
         Returns:
-            List of Video objects
+            List of Video objects in page order
         """
-        endpoint = self._get_endpoint(user_id, "/videos")
+        per_page = self.DEFAULT_PER_PAGE
 
         # Fetch first page to get total count
         logger.info("Fetching page 1 to determine total videos...")
-        first_page = self._fetch_page(
-            endpoint, 1, 100, sort, direction, filter_playable
-        )
+        first_page = self._fetch_page(endpoint, 1, per_page, **page_kwargs)
 
         total = first_page.get("total", 0)
-        per_page = 100
         total_pages = (total + per_page - 1) // per_page
 
         if limit:
@@ -232,40 +239,37 @@ class VimeoClient:
 
         logger.info(f"Total videos: {total}, pages: {total_pages}")
 
-        # Parse first page results
         all_video_data = {1: first_page.get("data", [])}
+        failed_pages = []
 
         if on_progress:
             on_progress(1, total_pages)
 
-        if total_pages <= 1:
-            return [Video.from_vimeo_response(v) for v in all_video_data.get(1, [])]
-
         # Fetch remaining pages concurrently
-        remaining_pages = list(range(2, total_pages + 1))
-
-        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
-            future_to_page = {
-                executor.submit(
-                    self._fetch_page,
-                    endpoint, page, per_page, sort, direction, filter_playable
-                ): page
-                for page in remaining_pages
-            }
-
-            completed = 1  # Page 1 already done
-            for future in as_completed(future_to_page):
-                page_num = future_to_page[future]
-                completed += 1
+        if total_pages > 1:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                future_to_page = {
+                    executor.submit(self._fetch_page, endpoint, page, per_page, **page_kwargs): page
+                    for page in range(2, total_pages + 1)
+                }
 
-                try:
-                    result = future.result()
-                    all_video_data[page_num] = result.get("data", [])
-                    if on_progress:
-                        on_progress(completed, total_pages)
-                except Exception as e:
-                    logger.error(f"Failed to fetch page {page_num}: {e}")
-                    all_video_data[page_num] = []
+                completed = 1  # Page 1 already done
+                for future in as_completed(future_to_page):
+                    page_num = future_to_page[future]
+                    completed += 1
+
+                    try:
+                        all_video_data[page_num] = future.result().get("data", [])
+                        if on_progress:
+                            on_progress(completed, total_pages)
+                    except Exception as e:
+                        logger.error(f"Failed to fetch page {page_num} of {endpoint}: {e}")
+                        failed_pages.append(page_num)
+
+        if failed_pages:
+            raise VimeoAPIError(
+                f"Failed to fetch pages: {', '.join(map(str, sorted(failed_pages)))}"
+            )
 
         # Combine results in page order
         videos = []
@@ -277,6 +281,56 @@ class VimeoClient:
 
         return videos
 
+    def get_videos(
+        self,
+        user_id: str = None,
+        per_page: int = None,
+        page: int = 1,
+        sort: str = "date",
+        direction: str = "desc",
+        filter_playable: bool = True
+    ) -> Dict[str, Any]:
+        """Get videos for a user (single page)."""
+        per_page = min(per_page or self.DEFAULT_PER_PAGE, 100)
+        endpoint = self._get_endpoint(user_id, "/videos")
+        return self._fetch_page(endpoint, page, per_page, sort, direction, filter_playable)
+
+    def get_all_videos_fast(
+        self,
+        user_id: str = None,
+        sort: str = "date",
+        direction: str = "desc",
+        filter_playable: bool = True,
+        limit: int = None,
+        on_progress: callable = None
+    ) -> List[Video]:
+        """
+        Fetch all videos using concurrent page requests.
+
+        Fetches page 1 first to determine total pages, then fetches
+        all remaining pages in parallel using a thread pool.
+
+        Args:
+            user_id: User ID
+            sort: Sort field
+            direction: Sort direction
+            filter_playable: Only return playable videos
+            limit: Maximum number of videos to return
+            on_progress: Callback(pages_done, total_pages)
+
+        Returns:
+            List of Video objects
+        """
+        endpoint = self._get_endpoint(user_id, "/videos")
+        return self._fetch_all_pages(
+            endpoint,
+            limit=limit,
+            on_progress=on_progress,
+            sort=sort,
+            direction=direction,
+            filter_playable=filter_playable
+        )
+
     def iter_all_videos(
         self,
         user_id: str = None,
@@ -348,33 +402,7 @@ class VimeoClient:
             raise VimeoAPIError("Album ID is required")
 
         endpoint = self._get_endpoint(user_id, f"/albums/{album_id}/videos")
-
-        first_page = self._fetch_page(endpoint, 1, 100)
-        total = first_page.get("total", 0)
-        total_pages = (total + 99) // 100
-
-        all_video_data = {1: first_page.get("data", [])}
-
-        if total_pages > 1:
-            remaining = list(range(2, total_pages + 1))
-            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
-                future_to_page = {
-                    executor.submit(self._fetch_page, endpoint, p, 100): p
-                    for p in remaining
-                }
-                for future in as_completed(future_to_page):
-                    page_num = future_to_page[future]
-                    try:
-                        result = future.result()
-                        all_video_data[page_num] = result.get("data", [])
-                    except Exception as e:
-                        logger.error(f"Failed to fetch album page {page_num}: {e}")
-
-        videos = []
-        for page_num in sorted(all_video_data.keys()):
-            for vd in all_video_data[page_num]:
-                videos.append(Video.from_vimeo_response(vd))
-        return videos
+        return self._fetch_all_pages(endpoint)
 
     def iter_album_videos(
         self,
@@ -416,6 +444,20 @@ class VimeoClient:
         per_page = min(per_page or self.DEFAULT_PER_PAGE, 100)
         return self._fetch_page(endpoint, page, per_page)
 
+    def get_all_folder_videos_fast(
+        self,
+        folder_id: str = None,
+        user_id: str = None,
+        limit: int = None
+    ) -> List[Video]:
+        """Fetch all folder videos using concurrent requests."""
+        folder_id = folder_id or self._folder_id
+        if not folder_id:
+            raise VimeoAPIError("Folder ID is required")
+
+        endpoint = self._get_endpoint(user_id, f"/projects/{folder_id}/videos")
+        return self._fetch_all_pages(endpoint, limit=limit)
+
     def iter_folder_videos(
         self,
         folder_id: str = None,